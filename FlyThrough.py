@@ -398,6 +398,56 @@ def addSingleName(design, entity, groupName, attributeName):
         entity.attributes.add(groupName, attributeName, '')
 
 
+# Evaluates the points along a curve at the given lengths and returns their
+# coordinates as a list of [x, y, z] arrays. All of the evaluation is done
+# up front so the animation loop doesn't need to call back into Fusion.
+def getCoordinatesAtLengths(curveEval, startParam, lengths):
+    params = []
+    for length in lengths:
+        (retVal, param) = curveEval.getParameterAtLength(startParam, length)
+        if not retVal:
+            raise RuntimeError('Unable to find the curve parameter at length {}.'.format(length))
+        params.append(param)
+
+    (retVal, points) = curveEval.getPointsAtParameters(params)
+    if not retVal or len(points) != len(params):
+        # Fall back to evaluating the points one at a time.
+        points = []
+        for param in params:
+            (retVal, point) = curveEval.getPointAtParameter(param)
+            if not retVal:
+                raise RuntimeError('Unable to evaluate the curve at parameter {}.'.format(param))
+            points.append(point)
+
+    return [point.asArray() for point in points]
+
+
+# Drives the viewport camera during an animation. The camera is fetched and
+# configured once and the eye and target points are allocated once and then
+# updated in place for each frame, rather than creating new objects every frame.
+class cameraDriver:
+    def __init__(self, view, upDirection):
+        self.view = view
+        self.eyePoint = adsk.core.Point3D.create(0, 0, 0)
+        self.targetPoint = adsk.core.Point3D.create(0, 0, 0)
+
+        self.cam = view.camera
+        self.cam.isSmoothTransition = False
+        self.cam.upVector = upDirection
+
+    def moveTo(self, eyeCoords, targetCoords):
+        self.eyePoint.setWithArray(eyeCoords)
+        self.targetPoint.setWithArray(targetCoords)
+
+        cam = self.cam
+        cam.eye = self.eyePoint
+        cam.target = self.targetPoint
+
+        self.view.camera = cam
+        self.view.refresh()
+        adsk.doEvents()
+
+
 def doPathAnimation(inputs):
     try:
         view = _app.activeViewport
@@ -407,9 +457,6 @@ def doPathAnimation(inputs):
         smoothness = smoothInput.valueOne
         numPoints = int(smoothness * 20)
         
-        bankedInput = inputs.itemById('bankCamera')
-        isBanked = bankedInput.value
-            
         pathInput = adsk.core.SelectionCommandInput.cast(inputs.itemById('pathCurve'))
         pathCurve = pathInput.selection(0).entity
         pathEval = adsk.core.CurveEvaluator3D.cast(curveAsEvalOrPoint(pathCurve))
@@ -448,42 +495,20 @@ def doPathAnimation(inputs):
         (retVal, pathMin, pathMax) = pathEval.getParameterExtents()
         (retVal, pathLength) = pathEval.getLengthAtParameter(pathMin, pathMax)
         eyeTargetOffset = pathLength * .0001
-          
+
+        # Compute all of the eye and target points before starting the animation.
+        # The eye trails the target by a small offset. On the first frame the eye
+        # would be before the start of the curve, so the eye starts at the start of
+        # the curve and the target is moved ahead by the offset instead.
+        eyeLengths = [max(pathLength * (step/numPoints) - eyeTargetOffset, 0.0) for step in range(0, numPoints)]
+        targetLengths = [length + eyeTargetOffset for length in eyeLengths]
+        eyeCoords = getCoordinatesAtLengths(pathEval, pathMin, eyeLengths)
+        targetCoords = getCoordinatesAtLengths(pathEval, pathMin, targetLengths)
+
+        driver = cameraDriver(view, upDirection)
         for step in range(0, numPoints):
-            currentEyeLength = (pathLength * (step/numPoints)) - eyeTargetOffset  
-            (retVal, currentEyeParam) = pathEval.getParameterAtLength(pathMin, currentEyeLength)
-            (retVal, currentEyePoint) = pathEval.getPointAtParameter(currentEyeParam)
+            driver.moveTo(eyeCoords[step], targetCoords[step])
 
-            currentTargetLength = pathLength * (step/numPoints)  
-            (retVal, currentTargetParam) = pathEval.getParameterAtLength(pathMin, currentTargetLength)
-            (retVal, currentTargetPoint) = pathEval.getPointAtParameter(currentTargetParam)
-            
-            cam = view.camera
-            cam.isSmoothTransition = False                
-                
-            cam.eye = currentEyePoint
-            cam.target = currentTargetPoint
-            
-            if isBanked:
-#                (retVal, curvatureDirection, curvature) = pathEval.getCurvature(currentEyeParam)
-#                curvatureDirection.scaleBy(10)
-#                influence = math.sin(upDirection.angleTo(curvatureDirection))
-#                influence = influence * (1/curvature)
-#                forwardDirection = currentEyePoint.vectorTo(currentTargetPoint)
-#                sideDirection = upDirection.crossProduct(forwardDirection)
-#                sideDirection.normalize()
-#                sideDirection.scaleBy(influence)
-#                newUpDirection = upDirection.copy()
-#                newUpDirection.add(sideDirection)
-#                cam.upVector = newUpDirection
-                cam.upVector = upDirection
-            else:
-                cam.upVector = upDirection
-            
-            view.camera = cam
-            view.refresh()
-            adsk.doEvents()
-            
         if hidePaths and sketchIsVisible:
             parentSketch.isVisible = True
             pathInput.isEnabled = True
@@ -563,32 +588,23 @@ def doEyeTargetAnimation(inputs):
             (retVal, targetMin, targetMax) = targetEvalOrPoint.getParameterExtents() 
             (retVal, targetLength) = targetEvalOrPoint.getLengthAtParameter(targetMin, targetMax)    
            
+        # Compute all of the eye and target points before starting the animation.
+        if eyeIsPoint:
+            eyeCoords = [eyeEvalOrPoint.asArray()] * numPoints
+        else:
+            eyeLengths = [eyeLength * (step/numPoints) for step in range(0, numPoints)]
+            eyeCoords = getCoordinatesAtLengths(eyeEvalOrPoint, eyeMin, eyeLengths)
+
+        if targetIsPoint:
+            targetCoords = [targetEvalOrPoint.asArray()] * numPoints
+        else:
+            targetLengths = [targetLength * (step/numPoints) for step in range(0, numPoints)]
+            targetCoords = getCoordinatesAtLengths(targetEvalOrPoint, targetMin, targetLengths)
+
+        driver = cameraDriver(view, upDirection)
         for step in range(0, numPoints):
-            if eyeIsPoint:
-                currentEyePoint = eyeEvalOrPoint
-            else:
-                currentEyeLength = eyeLength * (step/numPoints)    
-                (retVal, currentEyeParam) = eyeEvalOrPoint.getParameterAtLength(eyeMin, currentEyeLength)
-                (retVal, currentEyePoint) = eyeEvalOrPoint.getPointAtParameter(currentEyeParam)
+            driver.moveTo(eyeCoords[step], targetCoords[step])
 
-            if targetIsPoint:
-                currentTargetPoint = targetEvalOrPoint
-            else:
-                currentTargetLength = targetLength * (step/numPoints)            
-                (retVal, currentTargetParam) = targetEvalOrPoint.getParameterAtLength(targetMin, currentTargetLength)
-                (retVal, currentTargetPoint) = targetEvalOrPoint.getPointAtParameter(currentTargetParam)
-            
-            cam = view.camera
-            cam.isSmoothTransition = False                
-                
-            cam.eye = currentEyePoint
-            cam.target = currentTargetPoint
-            cam.upVector = upDirection
-            
-            view.camera = cam
-            view.refresh()
-            adsk.doEvents() 
-            
         if hidePaths:
             if eyeSketchIsVisible:
                 eyeSketch.isVisible = True